@@ -4,46 +4,69 @@ A GUI for scheduling Kilosort to run at a future time.
 
 import sys
 import time
-import json
 import os
-from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from types import SimpleNamespace
 from qtpy.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QLabel, QPushButton, QFileDialog, 
-                            QDateTimeEdit, QLineEdit, QSpacerItem, QSizePolicy)
-from qtpy.QtCore import QTimer, Qt, QDateTime, QObject, Signal, QThread
+                            QDateTimeEdit, QLineEdit, QSpacerItem, QSizePolicy,
+                            QFileIconProvider, QFormLayout)
+from qtpy.QtCore import QTimer, Qt, QDateTime, QTime, QProcess
 from qtpy.QtGui import QFont
-import kilosort
 
-# Configuration import
-try:
-    import config
-except ImportError:
-    print("No configuration file found. Using default settings.")
-    
-    # Fallback configuration if config.py is missing
-    class config:
-        DEBUG_MODE = False
-        DEFAULT_DATA_FILE = "debug_data.txt"
-        DEFAULT_RESULTS_DIR = "debug_results"
-        DEFAULT_PROBE_FILE = "debug_probe.json"
-        DEFAULT_SCHEDULE_DELAY = 5
-        KILOSORT_SETTINGS = {}
-
-# Global debug variables
-DEBUG_MODE = config.DEBUG_MODE
-DEBUG_DATA_FILE = config.DEFAULT_DATA_FILE
-DEBUG_RESULTS_DIR = config.DEFAULT_RESULTS_DIR
-DEBUG_PROBE_FILE = config.DEFAULT_PROBE_FILE
-DEBUG_SCHEDULE_DELAY = config.DEFAULT_SCHEDULE_DELAY
-DEBUG_SCHEDULE_TIME = datetime.now() + timedelta(seconds=DEBUG_SCHEDULE_DELAY)
+# Fallback configuration if config.py is missing
+class _FallbackConfig:
+    DEBUG_MODE = False
+    DEFAULT_DATA_FILE = "debug_data.txt"
+    DEFAULT_RESULTS_DIR = "debug_results"
+    DEFAULT_PROBE_FILE = "debug_probe.json"
+    DEFAULT_SCHEDULE_DELAY = 5
+    KILOSORT_SETTINGS = {}
+
+
+# Command-line flag that makes this script run kilosort instead of the GUI
+WORKER_FLAG = '--run-kilosort'
+
+# Longest single wait (in ms) before re-checking the wall clock. QTimer counts
+# monotonic time, which drifts from the clock across DST changes and suspend.
+MAX_TIMER_INTERVAL = 60 * 1000
+
+# Keep file dialogs from stat-ing every entry (slow on network mounts)
+FILE_DIALOG_OPTIONS = (QFileDialog.DontUseCustomDirectoryIcons |
+                       QFileDialog.DontResolveSymlinks |
+                       QFileDialog.HideNameFilterDetails)
+
+@lru_cache(maxsize=None)
+def _get_cfg():
+    """
+    Import config.py on first use (or fall back to default settings) and
+    cache the values used by the GUI and kilosort
+    """
+    try:
+        import config
+    except ImportError:
+        print("No configuration file found. Using default settings.")
+        config = _FallbackConfig
+    return SimpleNamespace(
+        debug_mode=config.DEBUG_MODE,
+        data_file=config.DEFAULT_DATA_FILE,
+        data_dir=os.path.dirname(config.DEFAULT_DATA_FILE) if config.DEFAULT_DATA_FILE else '',
+        results_dir=config.DEFAULT_RESULTS_DIR or '',
+        probe_file=config.DEFAULT_PROBE_FILE,
+        probe_dir=os.path.dirname(config.DEFAULT_PROBE_FILE) if config.DEFAULT_PROBE_FILE else '',
+        schedule_delay=config.DEFAULT_SCHEDULE_DELAY,
+        kilosort_settings=dict(config.KILOSORT_SETTINGS),
+    )
+
 
 # Modify run_kilosort to use config settings
 def run_kilosort(data_file, results_dir, probe_file):
+    # Import here so the GUI does not pay for torch/CUDA initialization at startup
+    import kilosort
     probe = kilosort.io.load_probe(probe_file)
     
     # Use settings from config, with ability to override
-    settings = config.KILOSORT_SETTINGS.copy()
-    settings['n_chan_bin'] = probe['n_chan']
+    settings = {**_get_cfg().kilosort_settings, 'n_chan_bin': probe['n_chan']}
     
     ops, st, clu, tF, Wall, similar_templates, is_ref, est_contam_rate, kept_spikes = \
         kilosort.run_kilosort(settings=settings, filename=data_file,
@@ -51,53 +74,58 @@ def run_kilosort(data_file, results_dir, probe_file):
     return "Kilosort finished"
 
 
-class WorkerSignals(QObject):
-    output = Signal(str)
-    finished = Signal()
+def run_worker(args):
+    """
+    Run kilosort in the current process (the GUI launches this via QProcess)
+    
+    Args:
+        args (list): data_file, results_dir and probe_file
+    
+    Returns:
+        int: Exit code for the worker process
+    """
+    data_file, results_dir, probe_file = args
+    try:
+        print("Starting execution...\n")
+        # Run kilosort with the provided parameters
+        result = run_kilosort(data_file, results_dir, probe_file)
+        print(f"Execution completed: {result}\n")
+    except Exception as e:
+        print(f"Error during execution: {str(e)}")
+        return 1
+    return 0
 
 
-class SchedulerThread(QThread):
-    def __init__(self, scheduled_time, data_file, probe_file, results_dir):
-        super().__init__()
-        self.scheduled_time = scheduled_time
-        self.data_file = data_file
-        self.probe_file = probe_file
-        self.results_dir = results_dir
-        self.running = True
-        self.signals = WorkerSignals()
-
-    def run(self):
-        while self.running:
-            now = datetime.now()
-            if now >= self.scheduled_time:
-                try:
-                    print("Starting execution...\n")
-                    # Run kilosort with the provided parameters
-                    result = run_kilosort(self.data_file, self.results_dir, self.probe_file)
-                    print(f"Execution completed: {result}\n")
-                except Exception as e:
-                    print(f"Error during execution: {str(e)}")
-                
-                self.signals.finished.emit()
-                break
-            time.sleep(1)
-
-    def stop(self):
-        self.running = False
+class StockIconProvider(QFileIconProvider):
+    """
+    Icon provider that gives files and folders the stock file/folder icon, so
+    file dialogs do not look up a themed icon for each entry (slow on network mounts)
+    """
+    def icon(self, arg):
+        if isinstance(arg, QFileIconProvider.IconType):
+            return super().icon(arg)
+        return super().icon(QFileIconProvider.Folder if arg.isDir() else QFileIconProvider.File)
 
 
 class SchedulerApp(QMainWindow):
+    _BOLD_FONT = None  # Shared by all label instances, created on first use
+    _COUNTDOWN_STYLE = "font-size: 20px;"
+    _COUNTDOWN_FMT = "Time until execution: {}d {}h {}m {}s".format
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("FutureSort: Kilosort scheduler")
         self.scheduled_job = None
+        self.process = None
         self.running = False
+        self._last_countdown = None  # Last text shown by update_countdown
+        cfg = _get_cfg()
         
         # Initialize debug values if in debug mode
-        if DEBUG_MODE:
-            self.data_file = DEBUG_DATA_FILE
-            self.results_dir = DEBUG_RESULTS_DIR
-            self.probe_file = DEBUG_PROBE_FILE
+        if cfg.debug_mode:
+            self.data_file = cfg.data_file
+            self.results_dir = cfg.results_dir
+            self.probe_file = cfg.probe_file
         else:
             self.data_file = None
             self.results_dir = None
@@ -108,65 +136,49 @@ class SchedulerApp(QMainWindow):
         self.setCentralWidget(main_widget)
         layout = QVBoxLayout(main_widget)
         
-        # Create bold font for labels
-        bold_font = QFont()
-        bold_font.setBold(True)
+        # Create bold font for labels (needs a QApplication, so not at class definition)
+        if SchedulerApp._BOLD_FONT is None:
+            font = QFont()
+            font.setBold(True)
+            SchedulerApp._BOLD_FONT = font
+        bold_font = SchedulerApp._BOLD_FONT
         
-        # Data file selection
-        data_layout = QHBoxLayout()
-        data_label = QLabel("Data file:")
-        data_label.setFont(bold_font)
-        self.data_edit = QLineEdit()
-        self.data_edit.setReadOnly(True)
-        if DEBUG_MODE:
-            self.data_edit.setText(self.data_file)
-        data_button = QPushButton("Select")
-        data_button.setFixedWidth(70)  # Fixed width for all "Select" buttons
-        data_button.clicked.connect(self.select_data_file)
-        data_layout.addWidget(data_label)
-        data_layout.addWidget(self.data_edit)
-        data_layout.addWidget(data_button)
-        layout.addLayout(data_layout)
+        # File and folder selection rows
+        form_layout = QFormLayout()
+        # Match the old row layouts on every platform (macOS defaults differ)
+        form_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        form_layout.setLabelAlignment(Qt.AlignLeft)
+        self.data_edit = self._add_path_row(form_layout, "Data file:", 'data',
+                                            self.data_file, bold_font)
+        self.results_edit = self._add_path_row(form_layout, "Results folder:", 'results',
+                                               self.results_dir, bold_font)
+        self.probe_edit = self._add_path_row(form_layout, "Probe file:", 'probe',
+                                             self.probe_file, bold_font)
+        layout.addLayout(form_layout)
         
-        # Results folder selection
-        results_layout = QHBoxLayout()
-        results_label = QLabel("Results folder:")
-        results_label.setFont(bold_font)
-        self.results_edit = QLineEdit()
-        self.results_edit.setReadOnly(True)
-        if DEBUG_MODE:
-            self.results_edit.setText(self.results_dir)
-        results_button = QPushButton("Select")
-        results_button.setFixedWidth(70)
-        results_button.clicked.connect(self.select_results_dir)
-        results_layout.addWidget(results_label)
-        results_layout.addWidget(self.results_edit)
-        results_layout.addWidget(results_button)
-        layout.addLayout(results_layout)
+        # Shared by all file dialogs so they skip per-entry icon lookups
+        self._icon_provider = StockIconProvider()
         
-        # Probe file selection
-        probe_layout = QHBoxLayout()
-        probe_label = QLabel("Probe file:")
-        probe_label.setFont(bold_font)
-        self.probe_edit = QLineEdit()
-        self.probe_edit.setReadOnly(True)
-        if DEBUG_MODE:
-            self.probe_edit.setText(self.probe_file)
-        probe_button = QPushButton("Select")
-        probe_button.setFixedWidth(70)
-        probe_button.clicked.connect(self.select_probe_file)
-        probe_layout.addWidget(probe_label)
-        probe_layout.addWidget(self.probe_edit)
-        probe_layout.addWidget(probe_button)
-        layout.addLayout(probe_layout)
+        # Dialog settings for each "Select" button:
+        # (title, default_dir, filter, edit_widget, attr_name, is_dir)
+        self._pickers = {
+            'data': ("Select Data File", cfg.data_dir,
+                     "Data Files (*.dat *.bin);;All Files (*)",
+                     self.data_edit, 'data_file', False),
+            'results': ("Select Results Folder", cfg.results_dir,
+                        None, self.results_edit, 'results_dir', True),
+            'probe': ("Select Probe File", cfg.probe_dir,
+                      "Probe Files (*.json);;All Files (*)",
+                      self.probe_edit, 'probe_file', False),
+        }
         
         # DateTime selection
         datetime_layout = QHBoxLayout()
         datetime_label = QLabel("Schedule for:")
         datetime_label.setFont(bold_font)
         self.datetime_edit = QDateTimeEdit()
-        if DEBUG_MODE:
-            debug_time = DEBUG_SCHEDULE_TIME
+        if cfg.debug_mode:
+            debug_time = QDateTime.currentDateTime().addSecs(int(cfg.schedule_delay))
             self.datetime_edit.setDateTime(debug_time)
         else:
             current_time = QDateTime.currentDateTime()
@@ -186,19 +198,19 @@ class SchedulerApp(QMainWindow):
         # 5 seconds from now button
         five_sec_button = QPushButton("5s")
         five_sec_button.setToolTip("Set time to 5 seconds from now")
-        five_sec_button.clicked.connect(lambda: self.set_scheduled_time(value=5))
+        five_sec_button.clicked.connect(partial(self._set_relative_seconds, 5))
         preset_layout.addWidget(five_sec_button)
         
         # 10 PM today button
         ten_pm_button = QPushButton("10 PM")
         ten_pm_button.setToolTip("Set time to 10 PM today")
-        ten_pm_button.clicked.connect(lambda: self.set_scheduled_time(time_type='absolute', value=22))
+        ten_pm_button.clicked.connect(partial(self._set_absolute_hour, 22))
         preset_layout.addWidget(ten_pm_button)
         
         # 2 AM tomorrow button
         two_am_button = QPushButton("2 AM")
         two_am_button.setToolTip("Set time to 2 AM tomorrow")
-        two_am_button.clicked.connect(lambda: self.set_scheduled_time(time_type='absolute', value=2))
+        two_am_button.clicked.connect(partial(self._set_absolute_hour, 2))
         preset_layout.addWidget(two_am_button)
         
         datetime_layout.addLayout(preset_layout)
@@ -210,7 +222,7 @@ class SchedulerApp(QMainWindow):
         # Countdown label with spacing
         self.countdown_label = QLabel("Not scheduled")
         self.countdown_label.setAlignment(Qt.AlignCenter)
-        self.countdown_label.setStyleSheet("font-size: 20px;")  # Make the label bigger
+        self.countdown_label.setStyleSheet(self._COUNTDOWN_STYLE)  # Make the label bigger
         layout.addSpacing(20)  # Add spacing above the countdown label
         layout.addWidget(self.countdown_label)
         layout.addSpacing(20)  # Add spacing below the countdown label
@@ -227,87 +239,146 @@ class SchedulerApp(QMainWindow):
         button_layout.addWidget(self.cancel_button)
         layout.addLayout(button_layout)
         
-        # Setup timer for countdown
+        # Setup timer for countdown (only runs while a job is scheduled)
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_countdown)
-        self.timer.start(1000)  # Update every second
         
-        self.setMinimumSize(600, 200)
+        # Single-shot timer that fires when the scheduled time arrives
+        self.schedule_timer = QTimer(self)
+        self.schedule_timer.setSingleShot(True)
+        self.schedule_timer.setTimerType(Qt.PreciseTimer)
+        self.schedule_timer.timeout.connect(self._run_job)
         
-        # Create worker signals
-        self.worker_signals = WorkerSignals()
-        self.worker_signals.output.connect(self.append_output)
-        self.worker_signals.finished.connect(self.on_execution_finished)
-    def select_data_file(self):
-        # Use the directory from the default data file if it exists
-        default_dir = os.path.dirname(config.DEFAULT_DATA_FILE) if config.DEFAULT_DATA_FILE else ''
+        self.setMinimumSize(600, 200)
+
+    def _add_path_row(self, form_layout, label_text, kind, path, font):
+        """
+        Add a labelled read-only path field with a "Select" button to a form
         
-        file_name, _ = QFileDialog.getOpenFileName(
-            self, 
-            "Select Data File", 
-            directory=default_dir,  # Set the default directory
-            filter="Data Files (*.dat *.bin);;All Files (*)"
-        )
-        if file_name:
-            self.data_file = file_name
-            self.data_edit.setText(file_name)
-    
-    def select_results_dir(self):
-        # Use the default results directory if it exists
-        default_dir = config.DEFAULT_RESULTS_DIR if config.DEFAULT_RESULTS_DIR else ''
+        Args:
+            form_layout (QFormLayout): Layout to add the row to
+            label_text (str): Text for the row label
+            kind (str): Key of self._pickers used by the button
+            path (str): Initial path to show (or None)
+            font (QFont): Font for the row label
         
-        folder_name = QFileDialog.getExistingDirectory(
-            self, 
-            "Select Results Folder",
-            directory=default_dir  # Set the default directory
-        )
-        if folder_name:
-            self.results_dir = folder_name
-            self.results_edit.setText(folder_name)
-    
-    def select_probe_file(self):
-        # Use the directory from the default probe file if it exists
-        default_dir = os.path.dirname(config.DEFAULT_PROBE_FILE) if config.DEFAULT_PROBE_FILE else ''
+        Returns:
+            QLineEdit: The path field
+        """
+        label = QLabel(label_text)
+        label.setFont(font)
+        edit = QLineEdit()
+        edit.setReadOnly(True)
+        if path:
+            edit.setText(path)
+        button = QPushButton("Select")
+        button.setFixedWidth(70)  # Fixed width for all "Select" buttons
+        button.clicked.connect(partial(self._pick, kind))
+        row_layout = QHBoxLayout()
+        row_layout.addWidget(edit)
+        row_layout.addWidget(button)
+        form_layout.addRow(label, row_layout)
+        return edit
+
+    def _pick(self, kind, checked=False):
+        """
+        Show a file (or folder) dialog and store the selection
         
-        file_name, _ = QFileDialog.getOpenFileName(
-            self, 
-            "Select Probe File", 
-            directory=default_dir,  # Set the default directory
-            filter="Probe Files (*.json);;All Files (*)"
-        )
-        if file_name:
-            self.probe_file = file_name
-            self.probe_edit.setText(file_name)
+        Args:
+            kind (str): 'data', 'results' or 'probe' (a key of self._pickers)
+            checked (bool): Passed by the button's clicked signal (unused)
+        """
+        title, default_dir, file_filter, edit_widget, attr_name, is_dir = self._pickers[kind]
+        dialog = QFileDialog(self, title, default_dir)
+        dialog.setIconProvider(self._icon_provider)
+        if is_dir:
+            dialog.setFileMode(QFileDialog.Directory)
+            dialog.setOptions(FILE_DIALOG_OPTIONS | QFileDialog.ShowDirsOnly)
+        else:
+            dialog.setFileMode(QFileDialog.ExistingFile)
+            dialog.setOptions(FILE_DIALOG_OPTIONS)
+            dialog.setNameFilter(file_filter)
+        accepted = dialog.exec()
+        selected = dialog.selectedFiles()
+        # The dialog is parented to the window, so delete it (and its file system model)
+        dialog.deleteLater()
+        if accepted and selected:
+            selection = selected[0]
+            setattr(self, attr_name, selection)
+            edit_widget.setText(selection)
     
     def schedule_command(self):
         if not all([self.data_file, self.results_dir, self.probe_file]):
             return
         
         self.scheduled_time = self.datetime_edit.dateTime().toPyDateTime()
-        if self.scheduled_time <= datetime.now():
+        # The countdown and timer use this instead of re-reading the (editable) widget
+        self._scheduled_ts = self.scheduled_time.timestamp()
+        if self._scheduled_ts <= time.time():
             self.countdown_label.setText("Scheduled time has passed")
             self.schedule_button.setStyleSheet("")  # Reset button style
             return
         
-        # Create and start the scheduler thread
-        self.scheduler_thread = SchedulerThread(
-            self.scheduled_time,
-            self.data_file, 
-            self.probe_file, 
-            self.results_dir
-        )
-        self.scheduler_thread.signals.finished.connect(self.on_execution_finished)
-        self.scheduler_thread.start()
+        # Let the Qt event loop wake us up at the scheduled time
+        self.running = True
+        self._last_countdown = None
+        self._start_schedule_timer()
+        self.timer.start(1000)  # Update countdown every second
+        self.update_countdown()
         
         self.schedule_button.setEnabled(False)
         self.cancel_button.setEnabled(True)
         self.schedule_button.setStyleSheet("background-color: red; color: black;")
         self.schedule_button.setText("Scheduled")
 
+    def _start_schedule_timer(self):
+        remaining_ms = int((self._scheduled_ts - time.time()) * 1000)
+        self.schedule_timer.start(max(0, min(remaining_ms, MAX_TIMER_INTERVAL)))
+
+    def _run_job(self):
+        # Keep waiting in MAX_TIMER_INTERVAL steps until the wall clock reaches the scheduled time
+        if time.time() < self._scheduled_ts:
+            self._start_schedule_timer()
+            return
+        # Run kilosort in a separate process so its memory is released when it ends
+        if self.process is not None:
+            self.process.deleteLater()
+        self.process = QProcess(self)
+        self.process.setProcessChannelMode(QProcess.ForwardedChannels)
+        self.process.finished.connect(self._on_process_finished)
+        self.process.errorOccurred.connect(self._on_process_error)
+        self.process.start(sys.executable, ['-u', os.path.abspath(__file__), WORKER_FLAG,
+                                            self.data_file, self.results_dir, self.probe_file])
+
+    def _on_process_finished(self, exit_code, exit_status):
+        if not self.running:
+            self.on_cancel_finished()  # The process was killed by cancel_schedule
+        elif exit_status == QProcess.CrashExit or exit_code != 0:
+            # Kilosort raised (exit code 1) or the process crashed (e.g. killed for memory)
+            print(f"Kilosort process failed (exit code {exit_code})")
+            self.on_execution_finished("Action failed (see terminal output)")
+        else:
+            self.on_execution_finished()
+
+    def _on_process_error(self, error):
+        # finished is not emitted if the process could not be started
+        if error == QProcess.FailedToStart:
+            print(f"Error during execution: {self.process.errorString()}")
+            self.on_execution_finished("Action failed (see terminal output)")
+
     def cancel_schedule(self):
-        if hasattr(self, 'scheduler_thread'):
-            self.scheduler_thread.stop()
-            self.scheduler_thread.wait()  # Wait for the thread to finish
+        self.schedule_timer.stop()
+        self.timer.stop()
+        self.running = False
+        if self.process is not None and self.process.state() != QProcess.NotRunning:
+            # Don't block on the process exiting; the UI is reset from its finished signal
+            self.cancel_button.setEnabled(False)
+            self.countdown_label.setText("Cancelling...")
+            self.process.kill()
+            return
+        self.on_cancel_finished()
+
+    def on_cancel_finished(self):
         self.countdown_label.setText("Not scheduled")
         self.schedule_button.setEnabled(True)
         self.cancel_button.setEnabled(False)
@@ -316,33 +387,31 @@ class SchedulerApp(QMainWindow):
         print("Scheduled task cancelled")
 
     def update_countdown(self):
-        if not hasattr(self, 'scheduler_thread') or not self.scheduler_thread.isRunning():
+        if not self.running:
             return
         
-        scheduled_time = self.datetime_edit.dateTime().toPyDateTime()
-        now = datetime.now()
-        
-        if scheduled_time > now:
-            time_diff = scheduled_time - now
-            hours, remainder = divmod(time_diff.seconds, 3600)
+        remaining = self._scheduled_ts - time.time()
+        if remaining > 0:
+            days, remainder = divmod(int(remaining), 86400)
+            hours, remainder = divmod(remainder, 3600)
             minutes, seconds = divmod(remainder, 60)
-            self.countdown_label.setText(
-                f"Time until execution: {time_diff.days}d {hours}h {minutes}m {seconds}s"
-            )
+            countdown_text = self._COUNTDOWN_FMT(days, hours, minutes, seconds)
+            # Skip the relayout/repaint if the text did not change since the last tick
+            if countdown_text != self._last_countdown:
+                self.countdown_label.setText(countdown_text)
+                self._last_countdown = countdown_text
         else:
             self.countdown_label.setText("Action has been triggered")
+            self.timer.stop()
 
-    def append_output(self, text):
-        # This method is no longer needed since we are printing directly to stdout
-        pass
-
-    def on_execution_finished(self):
+    def on_execution_finished(self, message="Action finished"):
         self.running = False
+        self.timer.stop()
         self.schedule_button.setEnabled(True)
         self.cancel_button.setEnabled(False)
         self.schedule_button.setStyleSheet("")  # Reset button style when finished
         self.schedule_button.setText("Schedule")
-        self.countdown_label.setText("Action finished")
+        self.countdown_label.setText(message)
 
     def set_scheduled_time(self, time_type='relative', value=5, unit='seconds'):
         """
@@ -353,25 +422,29 @@ class SchedulerApp(QMainWindow):
             value (int): Number of seconds/hours to add, or specific hour (24h format) for absolute time
             unit (str): 'seconds' or 'hours'
         """
-        current_time = QDateTime.currentDateTime()
         if time_type == 'relative':
             if unit == 'seconds':
-                scheduled_time = current_time.addSecs(value)
+                self._set_relative_seconds(value)
             elif unit == 'hours':
-                scheduled_time = current_time.addSecs(value * 3600)
+                self._set_relative_seconds(value * 3600)
             else:
                 raise ValueError(f"Unsupported unit: {unit}")
         elif time_type == 'absolute':
-            current_date = datetime.now().date()
             if value < 0 or value > 23:
                 raise ValueError("Hour must be between 0 and 23")
-            # If time is earlier than current time, set to next day
-            absolute_time = datetime.combine(current_date, datetime.min.time().replace(hour=value))
-            if absolute_time <= datetime.now():
-                absolute_time += timedelta(days=1)
-            scheduled_time = QDateTime(absolute_time)
+            self._set_absolute_hour(value)
         else:
             raise ValueError(f"Unsupported time type: {time_type}")
+
+    def _set_relative_seconds(self, seconds, checked=False):
+        self.datetime_edit.setDateTime(QDateTime.currentDateTime().addSecs(seconds))
+
+    def _set_absolute_hour(self, hour, checked=False):
+        current_time = QDateTime.currentDateTime()
+        scheduled_time = QDateTime(current_time.date(), QTime(hour, 0))
+        # If time is earlier than current time, set to next day
+        if scheduled_time <= current_time:
+            scheduled_time = scheduled_time.addDays(1)
         self.datetime_edit.setDateTime(scheduled_time)
 
 
@@ -383,4 +456,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == [WORKER_FLAG]:
+        sys.exit(run_worker(sys.argv[2:]))
     main()